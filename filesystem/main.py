@@ -3,19 +3,524 @@ import httpx
 from mcp.server.fastmcp import FastMCP
 import os
 import shutil
-import aiofiles
+import stat
 import asyncio
+import codecs
+import errno
+import functools
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, List
-import csv
+from typing import Union, List, Iterator, Tuple, Iterable, Callable, Awaitable, Dict, Optional
 from typing import Union
-from docx import Document
-import pandas as pd
 import json
-import xml.etree.ElementTree as ET
+import zipfile
+from lxml import etree
+
+try:
+    import orjson  # 可选依赖，安装后用于加速 JSON 校验
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import yaml  # 需要安装 PyYAML 库以支持 YAML 文件
+    # 优先使用 libyaml 的 C 实现，PyYAML 未编译 libyaml 时回退到纯 Python 实现
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    _HAS_YAML = True
+except ImportError:
+    _HAS_YAML = False
+
+try:
+    from send2trash import send2trash  # 可选依赖，安装后非永久删除会将文件移入回收站
+    _HAS_SEND2TRASH = True
+except ImportError:
+    _HAS_SEND2TRASH = False
 
 mcp = FastMCP("filesystem")
 
+# 批量操作时同时执行的最大文件操作数，避免压垮网络文件系统
+_BATCH_CONCURRENCY = 16
+
+# search_files 并发遍历子文件夹时使用的线程数
+_SEARCH_WORKERS = 8
+
+# 非 UTF-8 的 XML 文件可能以这些 BOM 开头；UTF-32 须先于 UTF-16 判断，因为两者的小端 BOM 前缀相同
+_UNICODE_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+# 文件大小未知（例如报告为 0 的特殊文件）时每次 os.read 的字节数
+_READ_CHUNK_SIZE = 1 << 16
+
+# read_text_from_file 支持的各类文件扩展名（小写）
+_TEXT_EXTS = frozenset({".txt", ".log", ".md", ".ini", ".cfg", ".sql", ".bat", ".sh"})
+_JSON_EXTS = frozenset({".json"})
+_XML_EXTS = frozenset({".xml"})
+_CSV_EXTS = frozenset({".csv", ".tsv"})
+_EXCEL_EXTS = frozenset({".xlsx", ".xls"})
+_DOC_EXTS = frozenset({".docx", ".doc"})
+_HTML_EXTS = frozenset({".html", ".htm"})
+_YAML_EXTS = frozenset({".yaml", ".yml"})
+
+# 已经过压缩的文件格式，再次 deflate 几乎不能减小体积，打包时直接存储
+_PRECOMPRESSED_EXTS = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".zst",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+    ".mp3", ".aac", ".ogg", ".flac", ".mp4", ".mkv", ".avi", ".mov", ".webm",
+    ".docx", ".xlsx", ".pptx",
+})
+
+# 直接从 word/document.xml 中提取正文段落及其文本，取值规则与 python-docx 的 Paragraph.text 一致
+_DOCX_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+_DOCX_PARAGRAPHS = etree.XPath("/w:document/w:body/w:p", namespaces=_DOCX_NS)
+_DOCX_RUN_CONTENT = etree.XPath(
+    "(./w:r | ./w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:ptab"
+    " or self::w:br or self::w:cr or self::w:noBreakHyphen]",
+    namespaces=_DOCX_NS,
+)
+_W = "{%s}" % _DOCX_NS["w"]
+_DOCX_TAG_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+
+async def _run_batch(op, arg_tuples: Iterable[Tuple], action: str) -> List[bool]:
+    """
+    在线程池中并发执行批量文件操作，返回每个操作的成功状态。
+
+    操作按目标路径（每组参数的最后一个）分组：同一目标的操作按列表顺序依次执行，
+    与逐个执行时的结果一致（后面的操作生效），只有不同目标的操作会并发执行。
+
+    Args:
+        op: 阻塞的文件操作，例如 shutil.move、os.unlink。
+        arg_tuples (Iterable[Tuple]): 每次调用 op 的参数，最后一个参数为目标路径。
+        action (str): 用于错误日志的操作名称。
+
+    Returns:
+        List[bool]: 每个操作的成功状态列表，顺序与 arg_tuples 一致。
+    """
+    groups: Dict[str, List[Tuple[int, Tuple]]] = {}
+    for index, args in enumerate(arg_tuples):
+        target = os.path.normcase(os.path.normpath(args[-1]))
+        groups.setdefault(target, []).append((index, args))
+    results = [False] * sum(map(len, groups.values()))
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run(group: List[Tuple[int, Tuple]]) -> None:
+        for index, args in group:
+            try:
+                async with semaphore:
+                    await asyncio.to_thread(op, *args)
+                results[index] = True
+            except Exception as e:
+                print(f"{action}失败: {e}")
+
+    await asyncio.gather(*map(run, groups.values()))
+    return results
+
+
+async def _batch_transfer(op, src_paths: List[str], dst_dir: str, action: str) -> List[bool]:
+    """
+    将每个源文件以原文件名复制或移动到目标文件夹，返回每个文件的成功状态。
+
+    Args:
+        op: 接收 (src, dst) 的阻塞文件操作，例如 shutil.move。
+        src_paths (List[str]): 源文件路径列表。
+        dst_dir (str): 目标文件夹路径。
+        action (str): 用于错误日志的操作名称。
+
+    Returns:
+        List[bool]: 每个文件操作的成功状态列表，顺序与 src_paths 一致。
+    """
+    # 目标路径前缀只计算一次；POSIX 上只有一种分隔符，可直接用 rpartition 取文件名
+    dst_prefix = os.path.join(dst_dir, "")
+    if os.altsep is None:
+        basenames = [src.rpartition(os.sep)[2] for src in src_paths]
+    else:
+        basenames = list(map(os.path.basename, src_paths))
+    return await _run_batch(
+        op, ((src, dst_prefix + name) for src, name in zip(src_paths, basenames)), action
+    )
+
+
+def _scan_dir(directory: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    用 os.scandir 读取单层目录，返回 (文件条目列表, 子文件夹路径列表)。
+
+    与 os.walk 一致：指向文件夹的符号链接不会被展开，无法读取的目录视为空目录。
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _iter_file_entries(directory: str) -> Iterator[os.DirEntry]:
+    """
+    递归遍历文件夹，按 os.walk 的顺序逐个产出文件条目。
+    """
+    files, subdirs = _scan_dir(directory)
+    yield from files
+    for subdir in subdirs:
+        yield from _iter_file_entries(subdir)
+
+
+def _iter_files(folder_path: str) -> Iterator[str]:
+    """
+    递归遍历文件夹，逐个产出文件的完整路径。
+    """
+    for entry in _iter_file_entries(folder_path):
+        yield entry.path
+
+
+def _compile_matcher(keywords: List[str]) -> Callable[[str], bool]:
+    """
+    将关键词编译为文件名匹配函数。单个关键词直接做子串判断；
+    多个关键词合并为一个正则，每个文件名只需扫描一次即可匹配任一关键词。
+    """
+    if not keywords:
+        return lambda name: False
+    if len(keywords) == 1:
+        keyword = keywords[0]
+        return lambda name: keyword in name
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda name: pattern.search(name) is not None
+
+
+def _search_files(directory: str, keywords: List[str]) -> List[str]:
+    """
+    在线程池中并发遍历顶层子文件夹，返回文件名包含任一关键词的文件路径。
+    """
+    match = _compile_matcher(keywords)
+
+    def search(subdir: str) -> List[str]:
+        return [entry.path for entry in _iter_file_entries(subdir) if match(entry.name)]
+
+    files, subdirs = _scan_dir(directory)
+    results = [entry.path for entry in files if match(entry.name)]
+    with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as pool:
+        for matches in pool.map(search, subdirs):
+            results.extend(matches)
+    return results
+
+
+def _write_sheet(buf: io.StringIO, title: str, rows: Iterable[Iterable[Any]]) -> None:
+    """
+    将一个工作表按制表符分隔写入缓冲区，空单元格写为空字符串。
+    """
+    buf.write(f"# {title}\n")
+    for row in rows:
+        buf.write("\t".join("" if value is None else str(value) for value in row))
+        buf.write("\n")
+
+
+def _extract_excel_text(file_path: str) -> str:
+    """
+    以只读方式逐行读取 Excel 工作簿的所有工作表，不构建 DataFrame。
+    .xlsx 使用 openpyxl，.xls 使用 xlrd。
+    """
+    buf = io.StringIO()
+    if os.path.splitext(file_path)[1].lower() == ".xlsx":
+        from openpyxl import load_workbook  # 需要安装 openpyxl 库
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                _write_sheet(buf, ws.title, ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+    else:
+        import xlrd  # 需要安装 xlrd 库
+        book = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            for index in range(book.nsheets):
+                sheet = book.sheet_by_index(index)
+                _write_sheet(buf, sheet.name, (sheet.row_values(r) for r in range(sheet.nrows)))
+                book.unload_sheet(index)
+        finally:
+            book.release_resources()
+    return buf.getvalue()
+
+
+def _extract_docx_text(file_path: str) -> str:
+    """
+    读取 Word 文档正文，每个段落一行。
+    """
+    with zipfile.ZipFile(file_path) as z:
+        root = etree.fromstring(z.read("word/document.xml"))
+    return "\n".join(
+        "".join(map(_docx_element_text, _DOCX_RUN_CONTENT(p))) for p in _DOCX_PARAGRAPHS(root)
+    )
+
+
+def _docx_element_text(element) -> str:
+    """
+    将段落中的一个文本类元素转换为文本：w:t 取其文字，制表符为 \\t，换行为 \\n；
+    分页符和分栏符（w:br 的 type 为 page/column）不产生文本。
+    """
+    tag = element.tag
+    if tag == _W + "t":
+        return element.text or ""
+    if tag == _W + "br":
+        return "\n" if element.get(_W + "type", "textWrapping") == "textWrapping" else ""
+    return _DOCX_TAG_TEXT[tag]
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """
+    按 fstat 得到的大小一次读取整个文件，不经过 Python 文件对象的缓冲层。
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        remaining = size
+        # 通常第一次就读完整个文件；继续读到 EOF 以处理读取期间变大或大小未知的文件
+        while True:
+            chunk = os.read(fd, max(remaining, _READ_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_utf8(file_path: str) -> str:
+    """
+    一次读取整个文件并按 UTF-8 解码，不经过 Python 文本 I/O 层的增量解码。
+    """
+    return _read_bytes(file_path).decode("utf-8")
+
+
+def _extract_xml_text(file_path: str) -> str:
+    """
+    读取 XML 文件并原样返回文本。优先按 UTF-8 解码；
+    失败时按 XML 声明或 BOM 中的编码（例如 GBK、UTF-16）解码。
+    """
+    data = _read_bytes(file_path)
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        for bom, encoding in _UNICODE_BOMS:
+            if data.startswith(bom):
+                return data[len(bom):].decode(encoding)
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        encoding = etree.parse(io.BytesIO(data), parser).docinfo.encoding
+        return data.decode(encoding)
+
+
+async def _read_plain(file_path: str) -> Optional[str]:
+    """
+    按 UTF-8 读取文本文件并原样返回。
+    """
+    return await asyncio.to_thread(_read_utf8, file_path)
+
+
+async def _read_xml(file_path: str) -> Optional[str]:
+    """
+    读取 XML 文件，按文件声明的编码解码后原样返回。
+    """
+    return await asyncio.to_thread(_extract_xml_text, file_path)
+
+
+async def _read_json(file_path: str) -> Optional[str]:
+    """
+    读取 JSON 文件。只校验格式并原样返回，避免解析后再序列化一遍。
+    """
+    text = await asyncio.to_thread(_read_utf8, file_path)
+    # orjson 更严格（不接受 NaN、Infinity 和溢出的浮点数），校验失败时以标准库 json 的结果为准
+    if _HAS_ORJSON:
+        try:
+            orjson.loads(text)
+            return text
+        except orjson.JSONDecodeError:
+            pass
+    json.loads(text)
+    return text
+
+
+async def _read_excel(file_path: str) -> Optional[str]:
+    """
+    读取 Excel 文件中所有工作表的内容。
+    """
+    try:
+        return await asyncio.to_thread(_extract_excel_text, file_path)
+    except ImportError as e:
+        print(f"请安装 {e.name} 库以支持 Excel 文件: pip install {e.name}")
+        return None
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        print(f"读取 Excel 文件失败: {e}")
+        return None
+
+
+async def _read_docx(file_path: str) -> Optional[str]:
+    """
+    读取 Word 文件的正文段落。
+    """
+    try:
+        return await asyncio.to_thread(_extract_docx_text, file_path)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        print(f"读取 Word 文件失败: {e}")
+        return None
+
+
+def _extract_yaml_text(file_path: str) -> str:
+    """
+    解析 YAML 文件并重新格式化输出。
+    """
+    data = yaml.load(_read_utf8(file_path), Loader=_YAML_LOADER)
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+
+
+async def _read_yaml(file_path: str) -> Optional[str]:
+    """
+    读取 YAML 文件并重新格式化输出。
+    """
+    if not _HAS_YAML:
+        print("请安装 PyYAML 库以支持 YAML 文件: pip install pyyaml")
+        return None
+    try:
+        return await asyncio.to_thread(_extract_yaml_text, file_path)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        print(f"读取 YAML 文件失败: {e}")
+        return None
+
+
+# 文件扩展名（小写）到读取函数的映射。
+# XML、CSV/TSV 和 HTML 本身就是文本，原样返回，不做解析再序列化的往返。
+_READERS: Dict[str, Callable[[str], Awaitable[Optional[str]]]] = {
+    **dict.fromkeys(_TEXT_EXTS | _CSV_EXTS | _HTML_EXTS, _read_plain),
+    **dict.fromkeys(_JSON_EXTS, _read_json),
+    **dict.fromkeys(_XML_EXTS, _read_xml),
+    **dict.fromkeys(_EXCEL_EXTS, _read_excel),
+    **dict.fromkeys(_DOC_EXTS, _read_docx),
+    **dict.fromkeys(_YAML_EXTS, _read_yaml),
+}
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    复制文件内容和元数据，返回目标路径。与 shutil.copy2 一致：目标为文件夹时复制到该文件夹中，
+    源和目标为同一文件时抛出 SameFileError，源或目标为命名管道时抛出 SpecialFileError。
+
+    优先使用 os.copy_file_range 由内核直接传输数据（btrfs/xfs 上可直接共享数据块），
+    不支持时回退到 shutil.copyfileobj；没有 copy_file_range 的系统直接使用 shutil.copy2。
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    for path in (src, dst):
+        try:
+            st = os.stat(path)
+        except OSError:
+            # 文件不存在等错误交给下面的 open 报告
+            continue
+        # 打开命名管道会一直阻塞，与 shutil.copyfile 一样直接拒绝
+        if stat.S_ISFIFO(st.st_mode):
+            raise shutil.SpecialFileError(f"`{path}` is a named pipe")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        try:
+            while copied < size:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError:
+            pass
+        # 复制 copy_file_range 未能处理的剩余内容（例如跨文件系统或大小未知的文件）
+        shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _make_zip(src_dir: str, dst_zip: str, compression_level: int) -> str:
+    """
+    将文件夹打包为 dst_zip + ".zip"，条目结构与 shutil.make_archive 一致，返回 ZIP 文件路径。
+    已压缩的文件直接存储，其余文件按 compression_level 进行 deflate 压缩。
+    """
+    if not 0 <= compression_level <= 9:
+        raise ValueError(f"压缩级别必须在 0-9 之间: {compression_level}")
+    if not os.path.isdir(src_dir):
+        raise NotADirectoryError(f"文件夹不存在: {src_dir}")
+    zip_path = dst_zip + ".zip"
+    zip_abspath = os.path.abspath(zip_path)
+    # 与 shutil.make_archive 一致，目标文件夹不存在时自动创建
+    zip_dir = os.path.dirname(zip_path)
+    if zip_dir:
+        os.makedirs(zip_dir, exist_ok=True)
+    zf = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+    try:
+        with zf:
+            for root, dirs, files in os.walk(src_dir):
+                for name in sorted(dirs):
+                    path = os.path.join(root, name)
+                    zf.write(path, os.path.relpath(path, src_dir))
+                for name in files:
+                    path = os.path.join(root, name)
+                    # 跳过正在写入的 ZIP 文件本身（目标位于源文件夹内时）
+                    if not os.path.isfile(path) or os.path.abspath(path) == zip_abspath:
+                        continue
+                    if os.path.splitext(name)[1].lower() in _PRECOMPRESSED_EXTS:
+                        zf.write(path, os.path.relpath(path, src_dir), compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zf.write(path, os.path.relpath(path, src_dir))
+    except BaseException:
+        # 打包中途失败时删除写了一半的 ZIP 文件
+        try:
+            os.remove(zip_path)
+        except OSError:
+            pass
+        raise
+    return zip_path
+
+
+def _remove_file(file_path: str, permanent: bool) -> None:
+    """
+    删除单个文件：permanent 为 False 且安装了 send2trash 时移入回收站，否则直接删除。
+    与 os.unlink 一样拒绝文件夹，避免把整个目录树移入回收站。
+    """
+    if not _HAS_SEND2TRASH or permanent:
+        os.unlink(file_path)
+        return
+    if os.path.isdir(file_path) and not os.path.islink(file_path):
+        raise IsADirectoryError(errno.EISDIR, "不能删除文件夹", file_path)
+    send2trash(file_path)
+
+
+def _write_text(file_path: str, content: str) -> None:
+    """
+    以 UTF-8 写入文本文件。内容一次性写完，在线程中调用一次即可，比 aiofiles 少几次线程切换。
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
 
 @mcp.tool()
 async def create_file(file_path: str, content: str = "") -> bool:
@@ -30,8 +535,7 @@ async def create_file(file_path: str, content: str = "") -> bool:
         bool: 文件创建是否成功。
     """
     try:
-        async with aiofiles.open(file_path, mode='w') as f:
-            await f.write(content)
+        await asyncio.to_thread(_write_text, file_path, content)
         return True
     except Exception as e:
         print(f"创建文件失败: {e}")
@@ -53,8 +557,7 @@ async def save_file(file_path: str, content: str, file_format: str = "txt") -> b
     try:
         if not file_path.endswith(f".{file_format}"):
             file_path = f"{file_path}.{file_format}"
-        async with aiofiles.open(file_path, mode='w') as f:
-            await f.write(content)
+        await asyncio.to_thread(_write_text, file_path, content)
         return True
     except Exception as e:
         print(f"保存文件失败: {e}")
@@ -73,7 +576,7 @@ async def copy_file(src: str, dst: str) -> bool:
         bool: 文件复制是否成功。
     """
     try:
-        shutil.copy2(src, dst)
+        await asyncio.to_thread(_fast_copy, src, dst)
         return True
     except Exception as e:
         print(f"复制文件失败: {e}")
@@ -92,7 +595,7 @@ async def move_file(src: str, dst: str) -> bool:
         bool: 文件移动是否成功。
     """
     try:
-        shutil.move(src, dst)
+        await asyncio.to_thread(shutil.move, src, dst)
         return True
     except Exception as e:
         print(f"移动文件失败: {e}")
@@ -110,12 +613,7 @@ async def batch_copy_files(src_paths: List[str], dst_dir: str) -> List[bool]:
     Returns:
         List[bool]: 每个文件复制的成功状态列表。
     """
-    results = []
-    for src in src_paths:
-        dst = os.path.join(dst_dir, os.path.basename(src))
-        success = await copy_file(src, dst)
-        results.append(success)
-    return results
+    return await _batch_transfer(_fast_copy, src_paths, dst_dir, "复制文件")
 
 @mcp.tool()
 async def batch_move_files(src_paths: List[str], dst_dir: str) -> List[bool]:
@@ -129,12 +627,7 @@ async def batch_move_files(src_paths: List[str], dst_dir: str) -> List[bool]:
     Returns:
         List[bool]: 每个文件移动的成功状态列表。
     """
-    results = []
-    for src in src_paths:
-        dst = os.path.join(dst_dir, os.path.basename(src))
-        success = await move_file(src, dst)
-        results.append(success)
-    return results
+    return await _batch_transfer(shutil.move, src_paths, dst_dir, "移动文件")
 
 @mcp.tool()
 async def delete_file(file_path: str, permanent: bool = False) -> bool:
@@ -143,21 +636,37 @@ async def delete_file(file_path: str, permanent: bool = False) -> bool:
 
     Args:
         file_path (str): 要删除的文件路径。
-        permanent (bool, optional): 是否永久删除，默认为 False。
+        permanent (bool, optional): 是否永久删除，默认为 False。为 False 时，仅当服务端额外安装了
+            send2trash 库才会移入回收站；默认依赖中不包含该库，未安装时文件同样会被永久删除。
+            只能删除文件，传入文件夹路径会失败。
 
     Returns:
         bool: 文件删除是否成功。
     """
     try:
-        if permanent:
-            os.unlink(file_path)
-        else:
-            os.remove(file_path)
+        await asyncio.to_thread(_remove_file, file_path, permanent)
         return True
     except Exception as e:
         print(f"删除文件失败: {e}")
         return False
 
+@mcp.tool()
+async def batch_delete_files(file_paths: List[str], permanent: bool = False) -> List[bool]:
+    """
+    批量删除文件，返回每个文件删除是否成功。
+
+    Args:
+        file_paths (List[str]): 要删除的文件路径列表。
+        permanent (bool, optional): 是否永久删除，默认为 False。为 False 时，仅当服务端额外安装了
+            send2trash 库才会移入回收站；默认依赖中不包含该库，未安装时文件同样会被永久删除。
+            只能删除文件，传入文件夹路径会失败。
+
+    Returns:
+        List[bool]: 每个文件删除的成功状态列表。
+    """
+    remove = functools.partial(_remove_file, permanent=permanent)
+    return await _run_batch(remove, ((path,) for path in file_paths), "删除文件")
+
 @mcp.tool()
 async def restore_file_from_recycle_bin(file_path: str) -> bool:
     """
@@ -177,19 +686,20 @@ async def restore_file_from_recycle_bin(file_path: str) -> bool:
         return False
 
 @mcp.tool()
-async def search_files(directory: str, keyword: str) -> List[str]:
+async def search_files(directory: str, keyword: Union[str, List[str]]) -> List[str]:
     """
     搜索指定目录下的文件，返回匹配的文件路径列表。
 
     Args:
         directory (str): 要搜索的目录路径。
-        keyword (str): 搜索关键词。
+        keyword (Union[str, List[str]]): 搜索关键词，传入列表时返回包含任一关键词的文件。
 
     Returns:
         List[str]: 匹配的文件路径列表。
     """
     try:
-        return [os.path.join(root, file) for root, _, files in os.walk(directory) for file in files if keyword in file]
+        keywords = [keyword] if isinstance(keyword, str) else list(keyword)
+        return await asyncio.to_thread(_search_files, directory, keywords)
     except Exception as e:
         print(f"搜索文件失败: {e}")
         return []
@@ -213,19 +723,21 @@ async def create_folder(folder_path: str) -> bool:
         return False
 
 @mcp.tool()
-async def compress_folder(src_dir: str, dst_zip: str) -> bool:
+async def compress_folder(src_dir: str, dst_zip: str, compression_level: int = 6) -> bool:
     """
     压缩文件夹，返回是否成功。
 
     Args:
         src_dir (str): 要压缩的源文件夹路径。
         dst_zip (str): 压缩后的目标 ZIP 文件路径（不需要扩展名）。
+        compression_level (int, optional): 压缩级别（0-9），数值越小速度越快，默认为 6。
+            图片、视频、压缩包等已压缩的文件始终直接存储。
 
     Returns:
         bool: 压缩是否成功。
     """
     try:
-        shutil.make_archive(dst_zip, 'zip', src_dir)
+        await asyncio.to_thread(_make_zip, src_dir, dst_zip, compression_level)
         return True
     except Exception as e:
         print(f"压缩文件夹失败: {e}")
@@ -243,20 +755,13 @@ async def get_all_files(folder_path: str) -> List[str]:
         List[str]: 所有文件的完整路径列表。
     """
     try:
-        all_files = []
-        # 递归遍历文件夹
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                # 拼接文件的完整路径
-                file_path = os.path.join(root, file)
-                all_files.append(file_path)
-        return all_files
+        return await asyncio.to_thread(list, _iter_files(folder_path))
     except Exception as e:
         print(f"获取文件夹下所有文件失败: {e}")
         return []
 
 @mcp.tool()
-def read_text_from_file(file_path: str) -> Union[str, None]:
+async def read_text_from_file(file_path: str) -> Union[str, None]:
     """
     从文件中读取文本内容，支持多种文本文件格式。
 
@@ -267,80 +772,18 @@ def read_text_from_file(file_path: str) -> Union[str, None]:
         Union[str, None]: 文件中的文本内容。如果文件格式不支持或读取失败，返回 None。
     """
     try:
-        # 检查文件是否存在
-        if not os.path.exists(file_path):
-            print(f"文件不存在: {file_path}")
-            return None
-
-        # 获取文件扩展名
+        # 获取文件扩展名，按小写查找对应的读取函数
         _, file_ext = os.path.splitext(file_path)
-
-        # 读取纯文本文件
-        if file_ext in (".txt", ".log", ".md", ".ini", ".cfg", ".sql", ".bat", ".sh"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-
-        # 读取 JSON 文件
-        elif file_ext == ".json":
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return json.dumps(data, indent=4, ensure_ascii=False)
-
-        # 读取 XML 文件
-        elif file_ext == ".xml":
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            return ET.tostring(root, encoding="unicode")
-
-        # 读取 CSV 或 TSV 文件
-        elif file_ext in (".csv", ".tsv"):
-            delimiter = "," if file_ext == ".csv" else "\t"
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=delimiter)
-                return "\n".join([delimiter.join(row) for row in reader])
-
-        # 读取 Excel 文件
-        elif file_ext in (".xlsx", ".xls"):
-            try:
-                df = pd.read_excel(file_path, sheet_name=None)
-                return "\n".join([df[sheet].to_string() for sheet in df])
-            except Exception as e:
-                print(f"读取 Excel 文件失败: {e}")
-                return None
-
-        # 读取 Word 文件
-        elif file_ext in (".docx", ".doc"):
-            try:
-                doc = Document(file_path)
-                return "\n".join([p.text for p in doc.paragraphs])
-            except Exception as e:
-                print(f"读取 Word 文件失败: {e}")
-                return None
-
-        # 读取 HTML 文件
-        elif file_ext in (".html", ".htm"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-
-        # 读取 YAML 文件
-        elif file_ext in (".yaml", ".yml"):
-            try:
-                import yaml  # 需要安装 PyYAML 库
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    return yaml.dump(data, default_flow_style=False, allow_unicode=True)
-            except ImportError:
-                print("请安装 PyYAML 库以支持 YAML 文件: pip install pyyaml")
-                return None
-            except Exception as e:
-                print(f"读取 YAML 文件失败: {e}")
-                return None
-
-        # 不支持的文件格式
-        else:
+        reader = _READERS.get(file_ext.lower())
+        if reader is None:
             print(f"不支持的文件格式: {file_ext}")
             return None
+        return await reader(file_path)
 
+    except FileNotFoundError:
+        # 不预先检查文件是否存在，直接由打开文件时的异常判断，少一次 stat 调用
+        print(f"文件不存在: {file_path}")
+        return None
     except Exception as e:
         print(f"读取文件失败: {e}")
         return None